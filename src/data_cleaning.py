@@ -1,97 +1,225 @@
 """End-to-end cleaning pipeline for the Zomato delivery dataset."""
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+from pandas.api.types import is_numeric_dtype
+
+# Copy-on-Write turns the shallow copies taken by each stage into views that are only
+# materialised column by column when written to. pandas 3 always enables it and deprecates
+# the option; on pandas 2 importing this module enables it for the whole session.
+PANDAS_MAJOR_VERSION = int(pd.__version__.split(".")[0])
+if PANDAS_MAJOR_VERSION < 3:
+    pd.set_option("mode.copy_on_write", True)
 
 # Define canonical file locations to keep CLI usage simple.
 RAW_DATA_PATH = Path("data/raw/zomato_dataset.csv")
-PROCESSED_DATA_PATH = Path("data/processed/zomato_deliveries_clean.csv")
+PROCESSED_DATA_PATH = Path("data/processed/zomato_deliveries_clean.parquet")
+# Cleaned outputs keyed by a hash of the raw file and of this module's source.
+CACHE_DIR = Path("data/processed/.cache")
 
 # Known spelling fixes for categorical values discovered during profiling.
 CITY_REMAP = {"Metropolitian": "Metropolitan"}
 
+# Explicit Arrow types for the raw export so the CSV reader skips type inference and stores
+# the coordinate/rating columns in 32-bit floats. Text columns stay strings for the
+# cleaning steps below; columns not listed here fall back to Arrow inference.
+RAW_COLUMN_TYPES: Dict[str, pa.DataType] = {
+    "ID": pa.string(),
+    "Delivery_person_ID": pa.string(),
+    "Delivery_person_Age": pa.float32(),
+    "Delivery_person_Ratings": pa.float32(),
+    "Restaurant_latitude": pa.float32(),
+    "Restaurant_longitude": pa.float32(),
+    "Delivery_location_latitude": pa.float32(),
+    "Delivery_location_longitude": pa.float32(),
+    "Order_Date": pa.string(),
+    "Time_Orderd": pa.string(),
+    "Time_Order_picked": pa.string(),
+    "Weather_conditions": pa.string(),
+    "Road_traffic_density": pa.string(),
+    "Vehicle_condition": pa.int8(),
+    "Type_of_order": pa.string(),
+    "Type_of_vehicle": pa.string(),
+    "multiple_deliveries": pa.float32(),
+    "Festival": pa.string(),
+    "City": pa.string(),
+    "Time_taken (min)": pa.float32(),
+}
+
+# Placeholder strings that stand in for missing values in the raw export.
+MISSING_STRINGS = ["", "nan", "None", "NaN", "NULL"]
+MISSING_VALUE_SET = pa.array(MISSING_STRINGS, type=pa.string())
+
+# Precomputed HH:MM labels indexed by minute of the day (0 to 1439).
+_HHMM_TABLE = np.array([f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)], dtype=object)
+
+# Grammar for raw time-of-day values: H:M or HH:MM with optional :SS seconds, or an Excel day
+# fraction, optionally padded with whitespace.
+TIME_PATTERN = r"^\s*(?:(?P<hour>\d{1,2}):(?P<minute>\d{1,2})(?::\d{2})?|(?P<fraction>\d+(?:\.\d+)?))\s*$"
+# Built once and shared by every standardise_time_column call.
+TIME_PATTERN_OPTIONS = pc.ExtractRegexOptions(TIME_PATTERN)
+
 
 def load_raw_dataset(path: Path = RAW_DATA_PATH) -> pd.DataFrame:
-    """Load the raw CSV into a DataFrame without applying any coercion."""
-    # Use pandas defaults so that profile statistics match earlier explorations.
-    return pd.read_csv(path)
+    """Load the raw CSV into a DataFrame using the multithreaded Arrow reader."""
+    # Placeholders become nulls while the reader scans each field, so later steps never see
+    # them; this extends the Arrow defaults, matching pandas' keep_default_na behaviour.
+    convert_options = pv.ConvertOptions(
+        column_types=RAW_COLUMN_TYPES,
+        null_values=list(dict.fromkeys(pv.ConvertOptions().null_values + MISSING_STRINGS)),
+        strings_can_be_null=True,
+    )
+    table = pv.read_csv(path, convert_options=convert_options)
+    return table.to_pandas(types_mapper=_arrow_string_mapper)
 
 
-def tidy_string_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Trim whitespace and normalise obvious categorical quirks."""
-    cleaned = df.copy()
+def _arrow_string_mapper(arrow_type: pa.DataType) -> pd.ArrowDtype | None:
+    """Keep text columns Arrow-backed; other columns convert to regular NumPy dtypes."""
+    return pd.ArrowDtype(pa.string()) if arrow_type == pa.string() else None
+
 
-    # Strip leading/trailing spaces for every object column so comparisons are reliable.
-    string_cols = cleaned.select_dtypes(include="object").columns
-    for col in string_cols:
-        cleaned[col] = cleaned[col].astype(str).str.strip()
-        cleaned.loc[cleaned[col].isin({"", "nan", "None"}), col] = pd.NA
+def _stage_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy df for a stage, shallowly only while Copy-on-Write protects the caller's data."""
+    # Callers can switch Copy-on-Write off again on pandas 2, in which case writes to a
+    # shallow copy would leak into their frame.
+    copy_on_write = PANDAS_MAJOR_VERSION >= 3 or pd.get_option("mode.copy_on_write") is True
+    return df.copy(deep=not copy_on_write)
+
+
+def tidy_string_columns(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    """Trim whitespace and normalise obvious categorical quirks."""
+    cleaned = df if inplace else _stage_copy(df)
+
+    # Strip leading/trailing spaces for every string column so comparisons are reliable.
+    # The columns are moved into a single Arrow table so the trim runs as an Arrow compute
+    # kernel over contiguous UTF-8 buffers. The reader only nulls exact placeholders, so
+    # blank or padded ones (" ", " NaN ") are nulled here once trimmed.
+    string_cols = cleaned.select_dtypes(include=["object", "string"]).columns
+    if len(string_cols):
+        schema = pa.schema([(col, pa.string()) for col in string_cols])
+        # Object columns can mix numbers and text (e.g. pd.read_csv under low_memory), so
+        # render every value as text first, as astype(str) did, keeping missing values missing.
+        block = cleaned[string_cols].astype("string")
+        table = pa.Table.from_pandas(block, schema=schema, preserve_index=False)
+        for col, arr in zip(string_cols, table.itercolumns()):
+            arr = pc.utf8_trim_whitespace(arr)
+            arr = pc.if_else(pc.is_in(arr, value_set=MISSING_VALUE_SET), pa.scalar(None, pa.string()), arr)
+            cleaned[col] = pd.Series(pd.array(arr, dtype=pd.ArrowDtype(pa.string())), index=cleaned.index)
+
+    # Categorical columns only need their (few) category labels tidied, not every row.
+    for col in cleaned.select_dtypes(include="category").columns:
+        cleaned[col] = _tidy_categories(cleaned[col], CITY_REMAP if col == "City" else {})
 
     # Apply spelling corrections to categorical columns that were flagged during profiling.
-    if "City" in cleaned.columns:
+    if "City" in string_cols:
         cleaned["City"] = cleaned["City"].replace(CITY_REMAP)
 
     return cleaned
 
 
+def _tidy_categories(series: pd.Series, remap: Dict[str, str]) -> pd.Series:
+    """Strip, blank and remap category labels, merging labels that become equal."""
+    labels = pd.Series(series.cat.categories.astype(str)).str.strip().replace(remap)
+    labels = labels.where(~labels.isin(MISSING_STRINGS))
+    categories = pd.Index(sorted(labels.dropna().unique()))
+
+    # Re-point every code at its tidied label; codes of blanked labels become missing (-1).
+    # The trailing -1 sentinel maps missing rows (code -1) back to missing.
+    lookup = np.append(categories.get_indexer(labels), -1)
+    codes = lookup[series.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=series.index, name=series.name)
+
+
+def format_minutes_as_time_string(minutes: pd.Series) -> pd.Series:
+    """Render minute-of-day values as HH:MM strings, keeping missing entries as NA."""
+    values = minutes.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(values)
+    # Round to whole minutes and keep lookups inside the table, so out-of-range values
+    # saturate at 00:00/23:59 instead of failing or wrapping around through negative indices.
+    values = np.clip(np.round(values), 0, (24 * 60) - 1)
+    # Look the labels up by minute-of-day instead of building them with string operations.
+    formatted = np.full(len(values), None, dtype=object)
+    formatted[valid] = _HHMM_TABLE[values[valid].astype(np.int32)]
+    # Arrow-backed like the other text columns, so cached and fresh results share one dtype.
+    labels = pa.array(formatted, type=pa.string(), mask=~valid)
+    return pd.Series(pd.array(labels, dtype=pd.ArrowDtype(pa.string())), index=minutes.index)
+
+
 def convert_excel_fraction_to_time_string(fraction: pd.Series) -> pd.Series:
     """Convert Excel day-fraction numbers to HH:MM formatted strings."""
     # Drop missing entries so that we only transform genuinely numeric values.
     valid = fraction.dropna()
     if valid.empty:
-        return pd.Series([], dtype="object")
+        return pd.Series([], dtype=pd.ArrowDtype(pa.string()))
 
     # Translate numeric fractions into minutes within a 24-hour window.
     minutes = (valid * 24 * 60).round()
     # Guard against values equal to or exceeding 24 hours by capping at 23:59.
     minutes = minutes.clip(lower=0, upper=(24 * 60) - 1)
-    hours = (minutes // 60).astype(int)
-    mins = (minutes % 60).astype(int)
-    return hours.astype(str).str.zfill(2) + ":" + mins.astype(str).str.zfill(2)
+    return format_minutes_as_time_string(minutes)
 
 
-def standardise_time_column(df: pd.DataFrame, column: str) -> Tuple[pd.DataFrame, pd.Series]:
-    """Return DataFrame with a cleaned HH:MM time column and the corresponding minutes."""
-    cleaned = df.copy()
+def _extract_number(group: pa.Array) -> np.ndarray:
+    """Cast a regex capture group to floats, treating empty captures as NaN."""
+    group = pc.if_else(pc.equal(group, ""), pa.scalar(None, pa.string()), group)
+    return pc.cast(group, pa.float64()).to_numpy(zero_copy_only=False)
 
-    # Prepare a working copy that keeps the original values untouched for auditing.
-    raw_series = cleaned[column]
-    series = raw_series.astype(str).str.strip()
-    series.loc[series.isin({"", "nan", "None"})] = pd.NA
-
-    # Capture Excel-style fractions such as 0.458333333 that represent time of day.
-    fraction_mask = series.str.fullmatch(r"\d+(\.\d+)?", na=False)
-    fractions = pd.to_numeric(series.where(fraction_mask), errors="coerce")
-    converted_fraction_times = convert_excel_fraction_to_time_string(fractions)
-    series.loc[converted_fraction_times.index] = converted_fraction_times
-
-    # Handle HH:MM:SS values by truncating to HH:MM.
-    hhmmss_mask = series.str.fullmatch(r"\d{1,2}:\d{2}:\d{2}", na=False)
-    series.loc[hhmmss_mask] = series.where(hhmmss_mask).str.slice(0, 5)
 
-    # For entries exactly equal to "24:00" or other >23h times, clip down to 23:59.
-    overflow_mask = series.str.fullmatch(r"24:\d{2}", na=False)
-    series.loc[overflow_mask] = "23:59"
-
-    # Attempt parsing remaining values as HH:MM and record failures as missing.
-    parsed = pd.to_datetime(series, format="%H:%M", errors="coerce")
-    series.loc[parsed.isna()] = pd.NA
-
-    # Derive total minutes to simplify interval computations later on.
-    minutes = parsed.dt.hour * 60 + parsed.dt.minute
+def standardise_time_column(
+    df: pd.DataFrame, column: str, inplace: bool = False
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """Return DataFrame with a cleaned HH:MM time column and the corresponding minutes."""
+    cleaned = df if inplace else _stage_copy(df)
 
-    cleaned[column + "_clean"] = series
+    # Prepare a working copy that keeps the original values untouched for auditing.
+    text = pa.array(cleaned[column].astype("string"), type=pa.string())
+
+    # Split every value into hour/minute or Excel-fraction parts in a single regex pass;
+    # anything outside the grammar (including placeholders such as "nan") comes back as
+    # null and is treated as missing.
+    parts = pc.extract_regex(text, options=TIME_PATTERN_OPTIONS)
+    hour = _extract_number(pc.struct_field(parts, "hour"))
+    minute = _extract_number(pc.struct_field(parts, "minute"))
+    fraction = _extract_number(pc.struct_field(parts, "fraction"))
+
+    # Excel-style fractions such as 0.458333333 represent a share of the day; cap at 23:59.
+    fraction_minutes = np.clip(np.round(fraction * 24 * 60), 0, (24 * 60) - 1)
+    # HH:MM and HH:MM:SS values keep their hour and minute; 24:xx is clipped to 23:59 and
+    # any other out-of-range clock reading is recorded as missing.
+    clock_minutes = np.where(
+        hour == 24,
+        (24 * 60) - 1,
+        np.where((hour <= 23) & (minute <= 59), hour * 60 + minute, np.nan),
+    )
+    # Minute-of-day values (0-1439) are exact in float32, which halves the column size.
+    minutes = pd.Series(
+        np.where(np.isnan(fraction), clock_minutes, fraction_minutes).astype(np.float32),
+        index=cleaned.index,
+        name=column + "_minutes",
+    )
+
+    cleaned[column + "_clean"] = format_minutes_as_time_string(minutes)
     cleaned[column + "_minutes"] = minutes
 
     return cleaned, minutes
 
 
-def parse_order_dates(df: pd.DataFrame) -> pd.DataFrame:
+def parse_order_dates(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """Convert the Order_Date column into a proper datetime series."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
 
     if "Order_Date" in cleaned.columns:
         # Use DD-MM-YYYY format and mark unparseable entries for downstream handling.
@@ -100,75 +228,81 @@ def parse_order_dates(df: pd.DataFrame) -> pd.DataFrame:
     return cleaned
 
 
-def enforce_numeric_ranges(df: pd.DataFrame) -> pd.DataFrame:
+def enforce_numeric_ranges(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """Apply the numeric validation rules defined during data profiling."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
 
     # Flag implausible courier ages and ratings by converting them to missing values.
+    # The checks run on plain float32 arrays; NaN compares False, so gaps stay missing.
     if "Delivery_person_Age" in cleaned.columns:
-        mask_age = (cleaned["Delivery_person_Age"] < 18) | (cleaned["Delivery_person_Age"] > 60)
-        cleaned.loc[mask_age, "Delivery_person_Age"] = pd.NA
+        ages = cleaned["Delivery_person_Age"].to_numpy(dtype=np.float32, na_value=np.nan)
+        cleaned["Delivery_person_Age"] = np.where((ages < 18) | (ages > 60), np.nan, ages)
 
     if "Delivery_person_Ratings" in cleaned.columns:
-        mask_rating = (cleaned["Delivery_person_Ratings"] < 1) | (cleaned["Delivery_person_Ratings"] > 5)
-        cleaned.loc[mask_rating, "Delivery_person_Ratings"] = pd.NA
+        ratings = cleaned["Delivery_person_Ratings"].to_numpy(dtype=np.float32, na_value=np.nan)
+        cleaned["Delivery_person_Ratings"] = np.where((ratings < 1) | (ratings > 5), np.nan, ratings)
 
     if "multiple_deliveries" in cleaned.columns:
-        mask_multi = ~cleaned["multiple_deliveries"].isin([0, 1, 2, 3])
-        cleaned.loc[mask_multi, "multiple_deliveries"] = pd.NA
+        multi = cleaned["multiple_deliveries"].to_numpy(dtype=np.float32, na_value=np.nan)
+        cleaned["multiple_deliveries"] = np.where(np.isin(multi, [0, 1, 2, 3]), multi, np.nan)
 
     return cleaned
 
 
-def scrub_coordinates(df: pd.DataFrame) -> pd.DataFrame:
+def scrub_coordinates(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """Replace zero latitude/longitude pairs with missing values."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
     coord_cols = [
-        "Restaurant_latitude",
-        "Restaurant_longitude",
-        "Delivery_location_latitude",
-        "Delivery_location_longitude",
+        col
+        for col in [
+            "Restaurant_latitude",
+            "Restaurant_longitude",
+            "Delivery_location_latitude",
+            "Delivery_location_longitude",
+        ]
+        if col in cleaned.columns
     ]
-    for col in coord_cols:
-        if col in cleaned.columns:
-            cleaned.loc[cleaned[col] == 0, col] = pd.NA
+    if coord_cols:
+        # Scan all coordinate columns in one pass over a single float32 block.
+        coords = cleaned[coord_cols].to_numpy(dtype=np.float32, na_value=np.nan, copy=True)
+        coords[coords == 0] = np.nan
+        cleaned[coord_cols] = coords
     return cleaned
 
 
-def compute_time_intervals(df: pd.DataFrame) -> pd.DataFrame:
+def compute_time_intervals(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """Derive order-to-pickup and pickup-to-delivery intervals in minutes."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
 
     # Ensure prerequisite columns exist before attempting interval calculations.
     required_cols = {"Order_Date_clean", "Time_Orderd_minutes", "Time_Order_picked_minutes", "Time_taken (min)"}
     if not required_cols.issubset(cleaned.columns):
         return cleaned
 
-    # Build order and pickup timestamps from the parsed day plus time-of-day minutes.
-    order_datetime = cleaned["Order_Date_clean"] + pd.to_timedelta(cleaned["Time_Orderd_minutes"], unit="m")
-    pickup_datetime = cleaned["Order_Date_clean"] + pd.to_timedelta(cleaned["Time_Order_picked_minutes"], unit="m")
+    # Work directly on minute-of-day values; timestamps are only needed to detect day wraps.
+    order_minutes = cleaned["Time_Orderd_minutes"].to_numpy(dtype=np.float32, na_value=np.nan)
+    pickup_minutes = cleaned["Time_Order_picked_minutes"].to_numpy(dtype=np.float32, na_value=np.nan)
 
     # Adjust pickups that appear before the order time by assuming the dispatch happened after midnight.
-    negative_mask = pickup_datetime < order_datetime
-    pickup_datetime.loc[negative_mask] += pd.Timedelta(days=1)
-
-    # Compute the interval in minutes; invalid or missing inputs propagate as NA automatically.
-    order_to_pick = (pickup_datetime - order_datetime).dt.total_seconds() / 60
+    order_to_pick = pickup_minutes - order_minutes
+    order_to_pick = np.where(order_to_pick < 0, order_to_pick + 24 * 60, order_to_pick)
+    # Intervals are only defined for orders with a parsed date; missing inputs propagate as NaN.
+    order_to_pick[cleaned["Order_Date_clean"].isna().to_numpy()] = np.nan
     cleaned["order_to_pick_minutes"] = order_to_pick
 
     # Derive pickup-to-delivery by subtracting the measured order-to-delivery time.
-    cleaned["pickup_to_delivery_minutes"] = cleaned["Time_taken (min)"] - order_to_pick
+    time_taken = cleaned["Time_taken (min)"].to_numpy(dtype=np.float32, na_value=np.nan)
+    pickup_to_delivery = time_taken - order_to_pick
 
     # Negative results indicate inconsistent source data, so mark them as missing for now.
-    inconsistency_mask = cleaned["pickup_to_delivery_minutes"] < 0
-    cleaned.loc[inconsistency_mask, "pickup_to_delivery_minutes"] = pd.NA
+    cleaned["pickup_to_delivery_minutes"] = np.where(pickup_to_delivery < 0, np.nan, pickup_to_delivery)
 
     return cleaned
 
 
-def convert_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+def convert_categoricals(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """Cast high-cardinality string columns to categorical dtypes for efficiency."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
     categorical_columns = [
         "Weather_conditions",
         "Road_traffic_density",
@@ -183,9 +317,19 @@ def convert_categoricals(df: pd.DataFrame) -> pd.DataFrame:
     return cleaned
 
 
-def standardize_units(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+def _numeric_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Select columns as numbers, coercing only those that do not already have a numeric dtype."""
+    selected = df[columns]
+    # Upstream stages already emit float32/int8 columns, so this usually skips every column.
+    non_numeric = [col for col in columns if not is_numeric_dtype(selected[col])]
+    if non_numeric:
+        selected[non_numeric] = selected[non_numeric].apply(pd.to_numeric, errors="coerce")
+    return selected
+
+
+def standardize_units(df: pd.DataFrame, inplace: bool = False) -> Tuple[pd.DataFrame, Dict[str, int]]:
     """Ensure time-related columns are expressed in minutes and distances in kilometres."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
     adjustments: Dict[str, int] = {"time_unit_conversions": 0, "distance_standardised": 0}
 
     # Time columns expected to be in minutes; detect second-based entries heuristically.
@@ -196,23 +340,20 @@ def standardize_units(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
         "Time_Orderd_minutes",
         "Time_Order_picked_minutes",
     ]
-    for col in time_columns:
-        if col not in cleaned.columns:
-            continue
-        series = pd.to_numeric(cleaned[col], errors="coerce")
-        if series.dropna().empty:
-            cleaned[col] = series
-            continue
+    time_columns = [col for col in time_columns if col in cleaned.columns]
+    if time_columns:
+        # Check every time column in one frame-wide pass instead of one scan per column.
+        times = _numeric_columns(cleaned, time_columns)
 
         # Treat values larger than 3 hours that are neatly divisible by 60 as seconds.
-        suspect_mask = (series > 180) & (series % 60 == 0)
-        if suspect_mask.any() and suspect_mask.mean() > 0.8:
-            series = series / 60
-            adjustments["time_unit_conversions"] += int(suspect_mask.sum())
+        suspect = (times > 180) & (times % 60 == 0)
+        second_based = suspect.columns[suspect.mean() > 0.8]
+        if len(second_based):
+            times[second_based] = times[second_based] / 60
+            adjustments["time_unit_conversions"] += int(suspect[second_based].sum().sum())
 
         # Cap extreme values at 24 hours to avoid downstream skew.
-        series = series.clip(upper=24 * 60)
-        cleaned[col] = series
+        cleaned[time_columns] = times.clip(upper=24 * 60)
 
     distance_columns: List[str] = [
         "haversine_km",
@@ -222,7 +363,7 @@ def standardize_units(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
     for col in distance_columns:
         if col not in cleaned.columns:
             continue
-        series = pd.to_numeric(cleaned[col], errors="coerce")
+        series = cleaned[col] if is_numeric_dtype(cleaned[col]) else pd.to_numeric(cleaned[col], errors="coerce")
         if series.dropna().empty:
             cleaned[col] = series
             continue
@@ -236,9 +377,9 @@ def standardize_units(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
     return cleaned, adjustments
 
 
-def detect_outliers(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+def detect_outliers(df: pd.DataFrame, inplace: bool = False) -> Tuple[pd.DataFrame, Dict[str, int]]:
     """Clip extreme values using the IQR rule for key numeric columns."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
     outlier_counts: Dict[str, int] = {"outliers_capped": 0}
 
     columns_to_check = [
@@ -249,34 +390,30 @@ def detect_outliers(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
         "pickup_to_delivery_minutes",
     ]
 
-    for col in columns_to_check:
-        if col not in cleaned.columns:
-            continue
-        series = pd.to_numeric(cleaned[col], errors="coerce")
-        valid = series.dropna()
-        if valid.empty:
-            cleaned[col] = series
-            continue
+    columns_to_check = [col for col in columns_to_check if col in cleaned.columns]
+    if not columns_to_check:
+        return cleaned, outlier_counts
 
-        q1, q3 = valid.quantile([0.25, 0.75])
-        iqr = q3 - q1
-        if pd.isna(iqr) or iqr == 0:
-            cleaned[col] = series
-            continue
+    # A single quantile call yields the quartiles of every column (missing values are skipped).
+    values = _numeric_columns(cleaned, columns_to_check)
+    quartiles = values.quantile([0.25, 0.75])
+    q1, q3 = quartiles.loc[0.25], quartiles.loc[0.75]
+    iqr = q3 - q1
 
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        mask = (series < lower_bound) | (series > upper_bound)
-        outlier_counts["outliers_capped"] += int(mask.sum())
-        series = series.clip(lower=lower_bound, upper=upper_bound)
-        cleaned[col] = series
+    # Columns that are empty or have no spread get NaN bounds, which clip ignores.
+    has_spread = iqr.notna() & (iqr != 0)
+    lower_bound = (q1 - 1.5 * iqr).where(has_spread)
+    upper_bound = (q3 + 1.5 * iqr).where(has_spread)
+    mask = values.lt(lower_bound, axis=1) | values.gt(upper_bound, axis=1)
+    outlier_counts["outliers_capped"] += int(mask.sum().sum())
+    cleaned[columns_to_check] = values.clip(lower=lower_bound, upper=upper_bound, axis=1)
 
     return cleaned, outlier_counts
 
 
-def fill_missing_values(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+def fill_missing_values(df: pd.DataFrame, inplace: bool = False) -> Tuple[pd.DataFrame, Dict[str, int]]:
     """Impute missing values using data-type aware strategies."""
-    cleaned = df.copy()
+    cleaned = df if inplace else _stage_copy(df)
     fill_stats: Dict[str, int] = {
         "numeric_missing_filled": 0,
         "time_missing_filled": 0,
@@ -288,46 +425,42 @@ def fill_missing_values(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]
         time_columns.append("Time_taken (min)")
     time_columns = list(dict.fromkeys(time_columns))
 
-    for col in time_columns:
-        if col not in cleaned.columns:
-            continue
-        series = pd.to_numeric(cleaned[col], errors="coerce")
-        if series.isna().any():
-            valid = series.dropna()
-            if not valid.empty:
-                median_value = valid.median()
-                missing_count = int(series.isna().sum())
-                cleaned[col] = series.fillna(median_value)
-                fill_stats["time_missing_filled"] += missing_count
+    # Count gaps once, then compute every fill statistic with one reduction per strategy.
+    missing_counts = cleaned.isna().sum()
+    missing_cols = missing_counts.index[missing_counts > 0]
 
     numeric_cols = cleaned.select_dtypes(include=["number", "Float64", "Int64"]).columns.difference(time_columns)
-    for col in numeric_cols:
-        series = pd.to_numeric(cleaned[col], errors="coerce")
-        if series.isna().any():
-            valid = series.dropna()
-            if not valid.empty:
-                mean_value = valid.mean()
-                missing_count = int(series.isna().sum())
-                cleaned[col] = series.fillna(mean_value)
-                fill_stats["numeric_missing_filled"] += missing_count
-
-    categorical_cols = cleaned.select_dtypes(include=["object", "category"]).columns
-    for col in categorical_cols:
-        series = cleaned[col]
-        if series.isna().any():
-            mode_series = series.mode(dropna=True)
-            if not mode_series.empty:
-                mode_value = mode_series.iloc[0]
-                missing_count = int(series.isna().sum())
-                cleaned[col] = series.fillna(mode_value)
-                fill_stats["categorical_missing_filled"] += missing_count
+    categorical_cols = cleaned.select_dtypes(include=["object", "string", "category"]).columns.intersection(missing_cols)
+
+    fill_plan = [
+        ("time_missing_filled", cleaned[missing_cols.intersection(time_columns)].median(numeric_only=True)),
+        ("numeric_missing_filled", cleaned[numeric_cols.intersection(missing_cols)].mean()),
+    ]
+    if len(categorical_cols):
+        # mode() returns no rows when every one of these columns is entirely missing.
+        modes = cleaned[categorical_cols].mode(dropna=True)
+        if len(modes):
+            fill_plan.append(("categorical_missing_filled", modes.iloc[0]))
+
+    fill_values: Dict[str, object] = {}
+    for stat_key, values in fill_plan:
+        # Columns without a single observed value have no statistic and stay missing.
+        values = values.dropna()
+        fill_stats[stat_key] += int(missing_counts[values.index].sum())
+        fill_values.update(values.to_dict())
+
+    if inplace:
+        cleaned.fillna(fill_values, inplace=True)
+    else:
+        cleaned = cleaned.fillna(fill_values)
 
     return cleaned, fill_stats
 
 
 def remove_duplicates(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
     """Drop exact duplicates and resolve clashes on critical identifier combinations."""
-    cleaned = df.copy()
+    # drop_duplicates returns a new frame, so the caller's input is never modified here.
+    cleaned = df
     duplicate_stats: Dict[str, int] = {
         "duplicates_removed_exact": 0,
         "duplicates_removed_key": 0,
@@ -348,34 +481,44 @@ def remove_duplicates(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
             key_candidates.append(candidate)
 
     if len(key_candidates) >= 2:
-        sort_cols = [col for col in ["Order_Date_clean", "Time_Orderd_minutes", "Time_Order_picked_minutes"] if col in cleaned.columns]
-        if sort_cols:
-            cleaned = cleaned.sort_values(sort_cols)
+        # Rank rows by order time, then pickup time, folded into one numeric key so that a
+        # single hash aggregation can pick the earliest row per key without sorting the frame.
+        # Missing times rank after every real minute value (0-1440).
+        missing_rank = (24 * 60) + 1
+        sort_key = np.zeros(len(cleaned))
+        for col in ["Time_Orderd_minutes", "Time_Order_picked_minutes"]:
+            if col in cleaned.columns:
+                minutes = cleaned[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                sort_key = sort_key * (missing_rank + 1) + np.nan_to_num(minutes, nan=missing_rank)
+
+        keys = [cleaned[col].reset_index(drop=True) for col in key_candidates]
+        first_rows = pd.Series(sort_key).groupby(keys, sort=False, dropna=False, observed=True).idxmin()
         before_key = len(cleaned)
-        cleaned = cleaned.drop_duplicates(subset=key_candidates, keep="first")
+        cleaned = cleaned.iloc[np.sort(first_rows.to_numpy())]
         duplicate_stats["duplicates_removed_key"] = before_key - len(cleaned)
 
     cleaned = cleaned.reset_index(drop=True)
     return cleaned, duplicate_stats
 
 
-def normalize_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Return a copy of df where numeric columns are min-max scaled."""
-    normalized = df.copy()
+def normalize_numeric_columns(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    """Min-max scale numeric columns, returning a copy of df unless inplace is set."""
+    normalized = df if inplace else _stage_copy(df)
     numeric_cols = normalized.select_dtypes(include=["number", "Float64", "Int64"]).columns
-    for col in numeric_cols:
-        series = pd.to_numeric(normalized[col], errors="coerce")
-        valid = series.dropna()
-        if valid.empty:
-            normalized[col] = series
-            continue
-        min_val = valid.min()
-        max_val = valid.max()
-        if max_val == min_val:
-            normalized[col] = series.where(series.isna(), 0.0)
-            continue
-        scaled = (series - min_val) / (max_val - min_val)
-        normalized[col] = scaled
+    if numeric_cols.empty:
+        return normalized
+
+    # Scale every numeric column at once on a contiguous float32 block.
+    values = normalized[numeric_cols].to_numpy(dtype=np.float32, na_value=np.nan, copy=True)
+    # fmin/fmax skip NaNs like nanmin/nanmax but stay silent on all-missing columns; the NaN
+    # initial value also gives empty frames NaN bounds instead of a reduction error.
+    mins = np.fmin.reduce(values, axis=0, initial=np.nan)
+    ranges = np.fmax.reduce(values, axis=0, initial=np.nan) - mins
+    # Constant columns map to 0.0; all-missing columns have NaN ranges and stay missing.
+    ranges[ranges == 0] = 1
+    values -= mins
+    values /= ranges
+    normalized[numeric_cols] = values
     return normalized
 
 
@@ -383,34 +526,37 @@ def clean_dataset(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[st
     """Run the full cleaning pipeline and collect simple issue counters."""
     issues: Dict[str, int] = {}
 
-    cleaned = tidy_string_columns(df)
+    # Take one (lazy) copy of the raw input; every stage below then works on it in place.
+    # Categoricals are cast first so later comparisons, fills and duplicate checks work on
+    # integer codes rather than strings.
+    cleaned = convert_categoricals(_stage_copy(df), inplace=True)
+
+    cleaned = tidy_string_columns(cleaned, inplace=True)
 
-    cleaned, order_minutes = standardise_time_column(cleaned, "Time_Orderd")
+    cleaned, order_minutes = standardise_time_column(cleaned, "Time_Orderd", inplace=True)
     issues["Time_Orderd_clean_missing"] = cleaned["Time_Orderd_clean"].isna().sum()
 
-    cleaned, pickup_minutes = standardise_time_column(cleaned, "Time_Order_picked")
+    cleaned, pickup_minutes = standardise_time_column(cleaned, "Time_Order_picked", inplace=True)
     issues["Time_Order_picked_clean_missing"] = cleaned["Time_Order_picked_clean"].isna().sum()
 
-    cleaned = parse_order_dates(cleaned)
+    cleaned = parse_order_dates(cleaned, inplace=True)
     issues["Order_Date_parse_missing"] = cleaned["Order_Date_clean"].isna().sum()
 
-    cleaned = enforce_numeric_ranges(cleaned)
+    cleaned = enforce_numeric_ranges(cleaned, inplace=True)
 
-    cleaned = scrub_coordinates(cleaned)
+    cleaned = scrub_coordinates(cleaned, inplace=True)
 
-    cleaned = compute_time_intervals(cleaned)
+    cleaned = compute_time_intervals(cleaned, inplace=True)
 
-    cleaned, unit_stats = standardize_units(cleaned)
+    cleaned, unit_stats = standardize_units(cleaned, inplace=True)
     issues.update({k: v for k, v in unit_stats.items() if v})
 
-    cleaned, outlier_stats = detect_outliers(cleaned)
+    cleaned, outlier_stats = detect_outliers(cleaned, inplace=True)
     issues.update({k: v for k, v in outlier_stats.items() if v})
 
-    cleaned, fill_stats = fill_missing_values(cleaned)
+    cleaned, fill_stats = fill_missing_values(cleaned, inplace=True)
     issues.update({k: v for k, v in fill_stats.items() if v})
 
-    cleaned = convert_categoricals(cleaned)
-
     cleaned, duplicate_stats = remove_duplicates(cleaned)
     issues.update({k: v for k, v in duplicate_stats.items() if v})
 
@@ -419,26 +565,70 @@ def clean_dataset(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[st
     return cleaned, normalized, issues
 
 
-def save_processed_dataset(df: pd.DataFrame, path: Path = PROCESSED_DATA_PATH) -> None:
-    """Persist the cleaned dataset to disk."""
+def save_processed_dataset(df: pd.DataFrame, path: Path = PROCESSED_DATA_PATH, write_csv: bool = False) -> None:
+    """Persist the cleaned dataset to disk as Parquet, optionally with a CSV copy."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False)
+    # Parquet keeps dtypes and categories, so consumers skip CSV parsing and type inference.
+    df.to_parquet(path.with_suffix(".parquet"), compression="zstd", engine="pyarrow", index=False)
+    if write_csv:
+        df.to_csv(path.with_suffix(".csv"), index=False)
+
+
+def compute_cache_key(path: Path = RAW_DATA_PATH) -> str:
+    """Hash the raw file together with this module so cached results expire on code changes."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_or_clean_dataset(
+    path: Path = RAW_DATA_PATH, cache_dir: Path = CACHE_DIR
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    """Return clean_dataset results for path, reusing a cached Parquet copy when available."""
+    cache_path = cache_dir / f"{compute_cache_key(path)}.parquet"
+    if cache_path.exists():
+        table = pq.read_table(cache_path)
+        # Issue counters travel in the Parquet schema metadata next to the pandas metadata.
+        issues = json.loads(table.schema.metadata.get(b"cleaning_issues", b"{}"))
+        cleaned = table.to_pandas(types_mapper=_arrow_string_mapper)
+        return cleaned, normalize_numeric_columns(cleaned), issues
+
+    cleaned, normalized, issues = clean_dataset(load_raw_dataset(path))
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(cleaned, preserve_index=False)
+    issue_counts = json.dumps({key: int(count) for key, count in issues.items()})
+    table = table.replace_schema_metadata({**table.schema.metadata, b"cleaning_issues": issue_counts.encode()})
+    # Write next to the final path and rename into place so an interrupted run never leaves a
+    # truncated cache entry behind.
+    fd, temp_name = tempfile.mkstemp(dir=cache_dir, suffix=".parquet.tmp")
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        pq.write_table(table, temp_path, compression="zstd")
+        temp_path.replace(cache_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    # Entries for older raw files or module versions can never be hit again.
+    for stale_path in cache_dir.glob("*.parquet"):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+    return cleaned, normalized, issues
 
 
-def main() -> None:
+def main(write_csv: bool = False) -> None:
     """Execute the cleaning workflow and output a simple quality summary."""
-    # Step 1: Load the raw data from the canonical location.
-    raw_df = load_raw_dataset()
-
-    # Step 2: Apply the cleaning pipeline to standardise fields and engineer features.
-    cleaned_df, normalized_df, issues = clean_dataset(raw_df)
+    # Steps 1-2: Load and clean the raw data, or reuse the cached result for an unchanged file.
+    cleaned_df, normalized_df, issues = load_or_clean_dataset()
 
     # Step 3: Write the processed output for downstream analysis bundles.
-    save_processed_dataset(cleaned_df)
+    save_processed_dataset(cleaned_df, write_csv=write_csv)
 
     # Optionally persist the normalised view alongside the primary dataset for modelling experiments.
-    normalized_path = PROCESSED_DATA_PATH.with_name("zomato_deliveries_normalized.csv")
-    save_processed_dataset(normalized_df, normalized_path)
+    normalized_path = PROCESSED_DATA_PATH.with_name("zomato_deliveries_normalized.parquet")
+    save_processed_dataset(normalized_df, normalized_path, write_csv=write_csv)
 
     # Step 4: Emit a concise diagnostic summary to assist manual review.
     summary_lines = ["Cleaning summary:"]
@@ -447,7 +637,12 @@ def main() -> None:
     print("\n".join(summary_lines))
     print(f"Processed dataset saved to {PROCESSED_DATA_PATH}")
     print(f"Normalized dataset saved to {normalized_path}")
+    if write_csv:
+        processed_csv, normalized_csv = (path.with_suffix(".csv") for path in (PROCESSED_DATA_PATH, normalized_path))
+        print(f"CSV copies saved to {processed_csv} and {normalized_csv}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", action="store_true", help="also write CSV copies for external tooling")
+    main(write_csv=parser.parse_args().csv)
@@ -0,0 +1,374 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from src.data_cleaning import (
+    RAW_DATA_PATH,
+    _tidy_categories,
+    clean_dataset,
+    compute_time_intervals,
+    detect_outliers,
+    enforce_numeric_ranges,
+    fill_missing_values,
+    format_minutes_as_time_string,
+    load_or_clean_dataset,
+    load_raw_dataset,
+    normalize_numeric_columns,
+    remove_duplicates,
+    save_processed_dataset,
+    scrub_coordinates,
+    standardise_time_column,
+    standardize_units,
+    tidy_string_columns,
+)
+
+
+@pytest.mark.parametrize(
+    ("raw", "label", "minutes"),
+    [
+        ("0.5", "12:00", 720),
+        ("0.999999", "23:59", 1439),
+        ("21:55:00", "21:55", 1315),
+        ("7:05:00", "07:05", 425),
+        ("24:00", "23:59", 1439),
+        ("24:15", "23:59", 1439),
+        ("8:30", "08:30", 510),
+        ("12:5", "12:05", 725),
+        ("  9:15 ", "09:15", 555),
+    ],
+)
+def test_standardise_time_column_parses_supported_formats(raw, label, minutes):
+    cleaned, parsed = standardise_time_column(pd.DataFrame({"t": [raw]}), "t")
+
+    assert cleaned.loc[0, "t_clean"] == label
+    assert parsed.iloc[0] == minutes
+    assert cleaned.loc[0, "t"] == raw
+
+
+@pytest.mark.parametrize("raw", ["25:00", "12:60", "ab", "12:30pm", "", "nan", None])
+def test_standardise_time_column_marks_invalid_values_missing(raw):
+    cleaned, parsed = standardise_time_column(pd.DataFrame({"t": [raw]}, dtype="string"), "t")
+
+    assert pd.isna(cleaned.loc[0, "t_clean"])
+    assert np.isnan(parsed.iloc[0])
+
+
+def test_format_minutes_as_time_string_rounds_and_clips():
+    minutes = pd.Series([0.0, 59.6, 1439.0, 1500.0, -1.0, np.nan])
+
+    labels = format_minutes_as_time_string(minutes)
+
+    assert labels.iloc[:5].tolist() == ["00:00", "01:00", "23:59", "23:59", "00:00"]
+    assert pd.isna(labels.iloc[5])
+
+
+def test_tidy_categories_merges_labels_after_remap():
+    series = pd.Series(["Metropolitian ", "Metropolitan", " Urban", "Urban"], dtype="category")
+
+    tidied = _tidy_categories(series, {"Metropolitian": "Metropolitan"})
+
+    assert list(tidied.cat.categories) == ["Metropolitan", "Urban"]
+    assert tidied.tolist() == ["Metropolitan", "Metropolitan", "Urban", "Urban"]
+
+
+def test_tidy_categories_blanks_placeholder_labels():
+    series = pd.Series(["NaN ", "Jam", " ", None, "NULL"], dtype="category")
+
+    tidied = _tidy_categories(series, {})
+
+    assert list(tidied.cat.categories) == ["Jam"]
+    assert tidied.isna().tolist() == [True, False, True, True, True]
+
+
+def test_tidy_categories_handles_all_missing_column():
+    series = pd.Series([None, None], dtype="category", name="City")
+
+    tidied = _tidy_categories(series, {})
+
+    assert tidied.isna().all()
+    assert tidied.name == "City"
+    assert len(tidied.cat.categories) == 0
+
+
+def test_remove_duplicates_keeps_earliest_row_per_key():
+    df = pd.DataFrame(
+        {
+            "ID": ["a", "a", "a", "b"],
+            "Delivery_person_ID": ["p1", "p1", "p1", "p2"],
+            "Order_Date_clean": pd.to_datetime(["2022-02-12"] * 4),
+            "Time_Orderd_minutes": [600.0, 540.0, np.nan, 720.0],
+            "Time_Order_picked_minutes": [610.0, 555.0, 500.0, 735.0],
+            "Time_taken": [10.0, 20.0, 30.0, 40.0],
+        }
+    )
+
+    cleaned, stats = remove_duplicates(df)
+
+    assert cleaned["Time_taken"].tolist() == [20.0, 40.0]
+    assert stats == {"duplicates_removed_exact": 0, "duplicates_removed_key": 2}
+
+
+def test_remove_duplicates_breaks_order_time_ties_on_pickup_time():
+    df = pd.DataFrame(
+        {
+            "ID": ["a", "a"],
+            "Delivery_person_ID": ["p1", "p1"],
+            "Order_Date_clean": pd.to_datetime(["2022-02-12"] * 2),
+            "Time_Orderd_minutes": [600.0, 600.0],
+            "Time_Order_picked_minutes": [620.0, 610.0],
+        }
+    )
+
+    cleaned, _ = remove_duplicates(df)
+
+    assert cleaned["Time_Order_picked_minutes"].tolist() == [610.0]
+
+
+def test_fill_missing_values_uses_median_mean_and_mode():
+    df = pd.DataFrame(
+        {
+            "Time_Orderd_minutes": [600.0, np.nan, 660.0, 900.0],
+            "Delivery_person_Age": [20.0, 30.0, np.nan, 40.0],
+            "City": pd.Series(["Urban", None, "Urban", "Metropolitan"], dtype="category"),
+            "Festival": pd.Series(["No", "No", None, "Yes"], dtype="string"),
+        }
+    )
+
+    filled, stats = fill_missing_values(df)
+
+    assert filled["Time_Orderd_minutes"].tolist() == [600.0, 660.0, 660.0, 900.0]
+    assert filled["Delivery_person_Age"].tolist() == [20.0, 30.0, 30.0, 40.0]
+    assert filled["City"].tolist() == ["Urban", "Urban", "Urban", "Metropolitan"]
+    assert filled["Festival"].tolist() == ["No", "No", "No", "Yes"]
+    assert stats == {"numeric_missing_filled": 1, "time_missing_filled": 1, "categorical_missing_filled": 2}
+    assert df["Delivery_person_Age"].isna().sum() == 1
+
+
+def test_fill_missing_values_leaves_all_missing_columns_untouched():
+    df = pd.DataFrame(
+        {
+            "x": [1.0, None],
+            "Time_Orderd_minutes": [None, None],
+            "City": pd.Series([None, None], dtype="category"),
+        }
+    )
+
+    filled, stats = fill_missing_values(df)
+
+    assert filled["x"].tolist() == [1.0, 1.0]
+    assert filled["Time_Orderd_minutes"].isna().all()
+    assert filled["City"].isna().all()
+    assert stats == {"numeric_missing_filled": 1, "time_missing_filled": 0, "categorical_missing_filled": 0}
+
+
+def test_clean_dataset_handles_row_without_observed_categories():
+    raw = load_raw_dataset()
+    row = raw[raw["City"].isna()].head(1).reset_index(drop=True)
+
+    cleaned, _, _ = clean_dataset(row)
+
+    assert len(cleaned) == 1
+    assert cleaned["City"].isna().all()
+
+
+def test_normalize_numeric_columns_scales_to_unit_range():
+    df = pd.DataFrame(
+        {
+            "varying": [2.0, 4.0, np.nan, 6.0],
+            "constant": [3.0, 3.0, 3.0, np.nan],
+            "missing": [np.nan] * 4,
+            "label": ["a", "b", "c", "d"],
+        }
+    )
+
+    normalized = normalize_numeric_columns(df)
+
+    np.testing.assert_allclose(normalized["varying"], [0.0, 0.5, np.nan, 1.0])
+    np.testing.assert_allclose(normalized["constant"], [0.0, 0.0, 0.0, np.nan])
+    assert normalized["missing"].isna().all()
+    assert normalized["label"].tolist() == ["a", "b", "c", "d"]
+    assert df["varying"].tolist()[0] == 2.0
+
+
+def test_normalize_numeric_columns_accepts_empty_frame():
+    df = pd.DataFrame({"value": pd.Series([], dtype="float64"), "label": pd.Series([], dtype="object")})
+
+    normalized = normalize_numeric_columns(df)
+
+    assert normalized.empty
+    assert list(normalized.columns) == ["value", "label"]
+
+
+def test_enforce_numeric_ranges_blanks_implausible_values():
+    df = pd.DataFrame(
+        {
+            "Delivery_person_Age": pd.Series([15, 18, 60, 61, np.nan], dtype="float32"),
+            "Delivery_person_Ratings": pd.Series([0.5, 1.0, 5.0, 6.0, 4.5], dtype="float32"),
+            "multiple_deliveries": pd.Series([0, 3, 4, 1.5, np.nan], dtype="float32"),
+        }
+    )
+
+    checked = enforce_numeric_ranges(df)
+
+    np.testing.assert_array_equal(checked["Delivery_person_Age"], [np.nan, 18, 60, np.nan, np.nan])
+    np.testing.assert_array_equal(checked["Delivery_person_Ratings"], [np.nan, 1.0, 5.0, np.nan, 4.5])
+    np.testing.assert_array_equal(checked["multiple_deliveries"], [0, 3, np.nan, np.nan, np.nan])
+    assert (checked.dtypes == "float32").all()
+    assert df["Delivery_person_Age"].iloc[0] == 15
+
+
+def test_scrub_coordinates_blanks_zero_coordinates():
+    df = pd.DataFrame(
+        {
+            "Restaurant_latitude": pd.Series([0.0, 30.3, 12.9], dtype="float32"),
+            "Restaurant_longitude": pd.Series([78.0, 0.0, 77.6], dtype="float32"),
+            "Delivery_location_latitude": pd.Series([30.4, 30.3, np.nan], dtype="float32"),
+            "City": ["Urban", "Urban", "Metropolitan"],
+        }
+    )
+
+    scrubbed = scrub_coordinates(df)
+
+    assert scrubbed["Restaurant_latitude"].isna().tolist() == [True, False, False]
+    assert scrubbed["Restaurant_longitude"].isna().tolist() == [False, True, False]
+    assert scrubbed["Delivery_location_latitude"].isna().tolist() == [False, False, True]
+    assert scrubbed["Restaurant_latitude"].dtype == np.float32
+    assert scrubbed["City"].tolist() == ["Urban", "Urban", "Metropolitan"]
+    assert df["Restaurant_latitude"].iloc[0] == 0.0
+
+
+def test_standardize_units_converts_seconds_and_caps_long_times():
+    df = pd.DataFrame(
+        {
+            "Time_taken (min)": pd.Series([600, 1200, 1800, 2400, 3000], dtype="float32"),
+            "order_to_pick_minutes": pd.Series([10, 2000, np.nan, 15, 20], dtype="float32"),
+            "haversine_km": [1500.0, 2500.0, np.nan, 500.0, 1000.0],
+        }
+    )
+
+    standardized, adjustments = standardize_units(df)
+
+    assert standardized["Time_taken (min)"].tolist() == [10, 20, 30, 40, 50]
+    np.testing.assert_array_equal(standardized["order_to_pick_minutes"], [10, 1440, np.nan, 15, 20])
+    np.testing.assert_array_equal(standardized["haversine_km"], [1.5, 2.5, np.nan, 0.5, 1.0])
+    assert adjustments == {"time_unit_conversions": 5, "distance_standardised": 4}
+
+
+def test_detect_outliers_clips_only_columns_with_spread():
+    df = pd.DataFrame(
+        {
+            "Delivery_person_Age": pd.Series([20, 21, 22, 23, 100], dtype="float32"),
+            "Delivery_person_Ratings": pd.Series([4.0, 4.0, 4.0, 4.0, 1.0], dtype="float32"),
+            "Time_taken (min)": pd.Series([np.nan] * 5, dtype="float32"),
+        }
+    )
+
+    clipped, counts = detect_outliers(df)
+
+    assert clipped["Delivery_person_Age"].tolist() == [20, 21, 22, 23, 26]
+    assert clipped["Delivery_person_Ratings"].tolist() == [4.0, 4.0, 4.0, 4.0, 1.0]
+    assert clipped["Time_taken (min)"].isna().all()
+    assert counts == {"outliers_capped": 1}
+    assert df["Delivery_person_Age"].iloc[4] == 100
+
+
+def test_compute_time_intervals_wraps_past_midnight_and_skips_missing_dates():
+    df = pd.DataFrame(
+        {
+            "Order_Date_clean": pd.to_datetime(["2022-02-12", "2022-02-12", None, "2022-02-13"]),
+            "Time_Orderd_minutes": pd.Series([600, 1430, 600, np.nan], dtype="float32"),
+            "Time_Order_picked_minutes": pd.Series([615, 5, 615, 700], dtype="float32"),
+            "Time_taken (min)": pd.Series([40, 10, 40, 30], dtype="float32"),
+        }
+    )
+
+    intervals = compute_time_intervals(df)
+
+    np.testing.assert_array_equal(intervals["order_to_pick_minutes"], [15, 15, np.nan, np.nan])
+    np.testing.assert_array_equal(intervals["pickup_to_delivery_minutes"], [25, np.nan, np.nan, np.nan])
+    assert intervals["order_to_pick_minutes"].dtype == np.float32
+    assert "order_to_pick_minutes" not in df.columns
+
+
+def test_load_or_clean_dataset_round_trips_through_cache(tmp_path):
+    raw_path = tmp_path / "raw.csv"
+    with RAW_DATA_PATH.open() as source:
+        raw_path.write_text("".join(next(source) for _ in range(201)))
+    cache_dir = tmp_path / "cache"
+
+    cleaned, normalized, issues = load_or_clean_dataset(raw_path, cache_dir=cache_dir)
+    cached, cached_normalized, cached_issues = load_or_clean_dataset(raw_path, cache_dir=cache_dir)
+
+    assert [path.suffix for path in cache_dir.iterdir()] == [".parquet"]
+    tm.assert_frame_equal(cached, cleaned)
+    tm.assert_frame_equal(cached_normalized, normalized)
+    assert cached_issues == {key: int(count) for key, count in issues.items()}
+
+
+def test_load_or_clean_dataset_prunes_stale_cache_entries(tmp_path):
+    raw_path = tmp_path / "raw.csv"
+    with RAW_DATA_PATH.open() as source:
+        raw_path.write_text("".join(next(source) for _ in range(21)))
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "stale.parquet").write_bytes(b"")
+    (cache_dir / "notes.txt").write_text("keep")
+
+    load_or_clean_dataset(raw_path, cache_dir=cache_dir)
+
+    assert sorted(path.suffix for path in cache_dir.iterdir()) == [".parquet", ".txt"]
+    assert not (cache_dir / "stale.parquet").exists()
+
+
+def test_load_raw_dataset_reads_placeholders_as_missing(tmp_path):
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(
+        "ID,Delivery_person_Ratings,Weather_conditions,City\n"
+        "0x1,4.5,NaN,Urban\n"
+        "0x2,NaN,Fog,NULL\n"
+        "0x3,,None,\n"
+    )
+
+    raw = load_raw_dataset(raw_path)
+
+    assert raw["Weather_conditions"].isna().tolist() == [True, False, True]
+    assert raw["City"].isna().tolist() == [False, True, True]
+    assert raw["Delivery_person_Ratings"].dtype == np.float32
+    assert raw["Delivery_person_Ratings"].isna().tolist() == [False, True, True]
+
+
+def test_tidy_string_columns_trims_and_blanks_padded_placeholders():
+    df = pd.DataFrame({"a": [" ", " nan ", " NULL", " Fog "], "City": ["Metropolitian ", None, "Urban", " "]})
+
+    tidied = tidy_string_columns(df)
+
+    assert tidied["a"].isna().tolist() == [True, True, True, False]
+    assert tidied["a"].iloc[3] == "Fog"
+    assert tidied["City"].isna().tolist() == [False, True, False, True]
+    assert tidied["City"].iloc[0] == "Metropolitan"
+
+
+def test_save_processed_dataset_writes_parquet_by_default(tmp_path):
+    df = pd.DataFrame(
+        {
+            "City": pd.Series(["Urban", "Metropolitan"], dtype="category"),
+            "Time_taken (min)": pd.Series([25, 40], dtype="float32"),
+        }
+    )
+    path = tmp_path / "processed" / "clean.parquet"
+
+    save_processed_dataset(df, path)
+
+    assert sorted(p.name for p in path.parent.iterdir()) == ["clean.parquet"]
+    tm.assert_frame_equal(pd.read_parquet(path), df)
+
+
+def test_save_processed_dataset_adds_csv_copy_on_request(tmp_path):
+    df = pd.DataFrame({"City": ["Urban", "Metropolitan"], "Time_taken (min)": [25.0, 40.0]})
+    path = tmp_path / "clean.parquet"
+
+    save_processed_dataset(df, path, write_csv=True)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["clean.csv", "clean.parquet"]
+    tm.assert_frame_equal(pd.read_csv(tmp_path / "clean.csv"), df)